@@ -9,37 +9,129 @@ Improved, beginner-friendly GUI tool (PyQt5) to turn a list of images into an MP
 Dependencies:
     pip install PyQt5 Pillow opencv-python numpy
 
+Optional:
+    pip install av    (H.264 output, using NVENC / Quick Sync / VideoToolbox when available)
+    ffmpeg on PATH    (x264 / NVENC output through a pipe when PyAV is not installed)
+
 Features:
 - Drag & Drop images and folders (non-recursive)
 - Add files / add folder via dialogs
 - Reorder by dragging inside the list
 - Remove selected / clear list
 - Output size + frame interval (ms) settings
+- Frames per image (higher frame rate, each image decoded only once)
+- Codec selection (auto, mp4v, x264, NVENC H.264/HEVC)
 - EXIF auto-rotate support
 - Center-fit with black padding (keeps aspect ratio)
 - Progress bar + status text + cancel button
+- Optional completion dialog (remembered between sessions); a desktop notification
+  instead when the window is in the background
 - Multi-language UI switcher via radio buttons:
   German, English, French, Spanish, Russian
 """
 
+import io
+import multiprocessing
 import os
+import queue
+import shutil
+import string
+import struct
+import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from fractions import Fraction
+from functools import lru_cache, partial
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
-from PIL import Image, ImageOps
+import PIL
+from PIL import Image
+
+try:
+    import fcntl  # POSIX only; used for read-ahead hints on macOS
+except ImportError:
+    fcntl = None
+
+try:
+    import av  # optional: H.264 (hardware if available) through FFmpeg
+except ImportError:
+    av = None
 
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QLocale
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, pyqtSlot, QLocale, QAbstractListModel, QModelIndex, QSettings, QEvent
+)
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QListWidget, QListWidgetItem, QFileDialog, QLabel,
+    QPushButton, QListView, QFileDialog, QLabel,
     QSpinBox, QProgressBar, QMessageBox, QAbstractItemView,
-    QGroupBox, QRadioButton, QButtonGroup, QFormLayout
+    QGroupBox, QRadioButton, QButtonGroup, QFormLayout, QComboBox, QCheckBox,
+    QSystemTrayIcon, QStyle
 )
 
 SUPPORTED_EXTS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.webp')
+SUPPORTED_EXT_SET = frozenset(SUPPORTED_EXTS)
+
+# PyAV encoders in order of preference: GPU first, software x264 last
+AV_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox", "libx264")
+
+# Codec choices in the UI; "auto" walks AV_ENCODERS and falls back to OpenCV's mp4v
+CODECS = ("auto", "mp4v", "libx264", "h264_nvenc", "hevc_nvenc")
+
+# Keeps ffmpeg from flashing a console window on Windows (0 elsewhere)
+NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Upper bound for frames decoded ahead of the encoder (keeps 8K outputs from eating all RAM)
+PREFETCH_BYTES = 512 * 1024 * 1024
+
+# Sources at least this large are resized on the GPU when OpenCV has CUDA devices
+CUDA_MIN_PIXELS = 1920 * 1080
+
+# Minimum time between progress bar updates from the worker
+PROGRESS_INTERVAL_S = 0.05
+
+# Byte alignment of frame buffers handed to the encoder
+FRAME_ALIGN = 64
+
+# Frames queued for the background encoder thread
+WRITE_QUEUE_SIZE = 16
+
+# Characters of ffmpeg's error output kept for the error message
+FFMPEG_ERROR_TAIL = 300
+
+# Formats that cannot carry alpha / EXIF, so those checks can be skipped while decoding
+OPAQUE_EXTS = ('.jpg', '.jpeg')
+NO_EXIF_EXTS = ('.bmp', '.gif')
+TIFF_EXTS = ('.tif', '.tiff')
+
+# Pillow modes that carry transparency
+PIL_ALPHA_MODES = ('RGBA', 'RGBa', 'LA', 'La', 'PA')
+
+# Decoded by Pillow when the OpenCV build cannot read them (see pil_decoded_exts); much of
+# that work holds the GIL, so long lists of these are decoded in worker processes
+# (process start-up needs enough frames to pay off)
+PIL_DECODED_EXTS = ('.gif',)
+PROCESS_POOL_MIN_FRAMES = 32
+
+# Skipped files named in the completion dialog
+SKIPPED_EXAMPLES = 10
+
+# Error details longer than this are cut before they reach the status bar / dialog
+ERROR_TEXT_MAX = 500
+
+# Files ahead of the decoder that the OS is asked to pull into the page cache
+READAHEAD_FILES = 8
+
+# macOS has no posix_fadvise; F_RDADVISE (not exported by the fcntl module) does the same
+F_RDADVISE = getattr(fcntl, "F_RDADVISE", 44) if sys.platform == "darwin" and fcntl else None
+HAVE_READAHEAD = hasattr(os, "posix_fadvise") or F_RDADVISE is not None
 
 
 # --------------------------- i18n ---------------------------
@@ -54,6 +146,11 @@ I18N: Dict[str, Dict[str, str]] = {
         "btn_remove": "Remove selected",
         "btn_clear": "Clear list",
         "lbl_interval": "Interval (ms):",
+        "lbl_repeats": "Frames per image:",
+        "lbl_codec": "Codec:",
+        "codec_auto": "Automatic",
+        "lbl_threads": "Encoder threads:",
+        "chk_done_dialog": "Show dialog when finished",
         "lbl_width": "Width:",
         "lbl_height": "Height:",
         "btn_choose_out": "Choose output…",
@@ -89,6 +186,9 @@ I18N: Dict[str, Dict[str, str]] = {
         "group_language": "Language",
         "tip_list": "Drag & drop images or folders here. You can reorder entries by dragging them.",
         "tip_interval": "How long each image is shown (in milliseconds).",
+        "tip_repeats": "Video frames written per image. The image is still shown for the interval; higher values raise the frame rate (for players that dislike very low fps).",
+        "tip_codec": "Video encoder. Automatic picks a GPU H.264 encoder when available, otherwise x264 or MPEG-4 (mp4v). NVENC needs an NVIDIA GPU and PyAV or ffmpeg.",
+        "tip_threads": "CPU threads the video encoder may use (software encoders only).",
         "tip_size": "Target video size. Images are scaled to fit and padded with black bars if needed.",
         "tip_out": "Choose where the MP4 should be saved.",
         "tip_cancel": "Stop the current render (safe cancel).",
@@ -100,6 +200,11 @@ I18N: Dict[str, Dict[str, str]] = {
         "btn_remove": "Ausgewählte entfernen",
         "btn_clear": "Liste leeren",
         "lbl_interval": "Intervall (ms):",
+        "lbl_repeats": "Frames pro Bild:",
+        "lbl_codec": "Codec:",
+        "codec_auto": "Automatisch",
+        "lbl_threads": "Encoder-Threads:",
+        "chk_done_dialog": "Dialog nach Abschluss anzeigen",
         "lbl_width": "Breite:",
         "lbl_height": "Höhe:",
         "btn_choose_out": "Zieldatei auswählen…",
@@ -135,6 +240,9 @@ I18N: Dict[str, Dict[str, str]] = {
         "group_language": "Sprache",
         "tip_list": "Ziehe Bilder oder Ordner hier hinein. Du kannst Einträge per Drag & Drop umsortieren.",
         "tip_interval": "Wie lange jedes Bild angezeigt wird (in Millisekunden).",
+        "tip_repeats": "Anzahl Videoframes pro Bild. Das Bild wird weiterhin für das Intervall angezeigt; höhere Werte erhöhen die Bildrate (für Player, die sehr niedrige fps nicht mögen).",
+        "tip_codec": "Video-Encoder. Automatisch wählt einen GPU-H.264-Encoder, falls verfügbar, sonst x264 oder MPEG-4 (mp4v). NVENC benötigt eine NVIDIA-GPU und PyAV oder ffmpeg.",
+        "tip_threads": "CPU-Threads, die der Video-Encoder nutzen darf (nur Software-Encoder).",
         "tip_size": "Zielgröße des Videos. Bilder werden passend skaliert und ggf. mit schwarzen Balken aufgefüllt.",
         "tip_out": "Wähle, wo die MP4-Datei gespeichert werden soll.",
         "tip_cancel": "Aktuelles Rendern stoppen (sicherer Abbruch).",
@@ -146,6 +254,11 @@ I18N: Dict[str, Dict[str, str]] = {
         "btn_remove": "Supprimer la sélection",
         "btn_clear": "Vider la liste",
         "lbl_interval": "Intervalle (ms) :",
+        "lbl_repeats": "Images vidéo par image :",
+        "lbl_codec": "Codec :",
+        "codec_auto": "Automatique",
+        "lbl_threads": "Threads d'encodage :",
+        "chk_done_dialog": "Afficher une boîte de dialogue à la fin",
         "lbl_width": "Largeur :",
         "lbl_height": "Hauteur :",
         "btn_choose_out": "Choisir la sortie…",
@@ -181,6 +294,9 @@ I18N: Dict[str, Dict[str, str]] = {
         "group_language": "Langue",
         "tip_list": "Glissez-déposez des images ou des dossiers ici. Vous pouvez réorganiser en faisant glisser.",
         "tip_interval": "Durée d'affichage de chaque image (en millisecondes).",
+        "tip_repeats": "Nombre d'images vidéo écrites par image. L'image reste affichée pendant l'intervalle ; des valeurs plus élevées augmentent la fréquence (pour les lecteurs qui gèrent mal les très faibles fps).",
+        "tip_codec": "Encodeur vidéo. Automatique choisit un encodeur H.264 GPU si disponible, sinon x264 ou MPEG-4 (mp4v). NVENC nécessite un GPU NVIDIA et PyAV ou ffmpeg.",
+        "tip_threads": "Threads CPU utilisables par l'encodeur vidéo (encodeurs logiciels uniquement).",
         "tip_size": "Taille cible de la vidéo. Les images sont ajustées et complétées par des bandes noires si besoin.",
         "tip_out": "Choisissez où enregistrer le MP4.",
         "tip_cancel": "Arrêter le rendu en cours (annulation sûre).",
@@ -192,6 +308,11 @@ I18N: Dict[str, Dict[str, str]] = {
         "btn_remove": "Quitar seleccionados",
         "btn_clear": "Vaciar lista",
         "lbl_interval": "Intervalo (ms):",
+        "lbl_repeats": "Fotogramas por imagen:",
+        "lbl_codec": "Códec:",
+        "codec_auto": "Automático",
+        "lbl_threads": "Hilos del codificador:",
+        "chk_done_dialog": "Mostrar diálogo al terminar",
         "lbl_width": "Ancho:",
         "lbl_height": "Alto:",
         "btn_choose_out": "Elegir salida…",
@@ -227,6 +348,9 @@ I18N: Dict[str, Dict[str, str]] = {
         "group_language": "Idioma",
         "tip_list": "Arrastra y suelta imágenes o carpetas aquí. Puedes reordenar arrastrando.",
         "tip_interval": "Cuánto tiempo se muestra cada imagen (en milisegundos).",
+        "tip_repeats": "Fotogramas de vídeo escritos por imagen. La imagen se sigue mostrando durante el intervalo; valores más altos aumentan la tasa de fotogramas (para reproductores que no admiten fps muy bajos).",
+        "tip_codec": "Codificador de vídeo. Automático elige un codificador H.264 por GPU si está disponible; si no, x264 o MPEG-4 (mp4v). NVENC requiere una GPU NVIDIA y PyAV o ffmpeg.",
+        "tip_threads": "Hilos de CPU que puede usar el codificador de vídeo (solo codificadores por software).",
         "tip_size": "Tamaño objetivo del vídeo. Las imágenes se ajustan y se rellenan con negro si hace falta.",
         "tip_out": "Elige dónde guardar el MP4.",
         "tip_cancel": "Detener el render actual (cancelación segura).",
@@ -238,6 +362,11 @@ I18N: Dict[str, Dict[str, str]] = {
         "btn_remove": "Удалить выбранные",
         "btn_clear": "Очистить список",
         "lbl_interval": "Интервал (мс):",
+        "lbl_repeats": "Кадров на изображение:",
+        "lbl_codec": "Кодек:",
+        "codec_auto": "Автоматически",
+        "lbl_threads": "Потоки кодировщика:",
+        "chk_done_dialog": "Показывать окно по завершении",
         "lbl_width": "Ширина:",
         "lbl_height": "Высота:",
         "btn_choose_out": "Выбрать файл…",
@@ -273,6 +402,9 @@ I18N: Dict[str, Dict[str, str]] = {
         "group_language": "Язык",
         "tip_list": "Перетащите изображения или папки сюда. Порядок можно менять перетаскиванием.",
         "tip_interval": "Сколько показывать каждое изображение (в миллисекундах).",
+        "tip_repeats": "Сколько видеокадров записывать на изображение. Изображение по-прежнему показывается в течение интервала; большие значения повышают частоту кадров (для плееров, плохо работающих с очень низким fps).",
+        "tip_codec": "Видеокодер. «Автоматически» выбирает GPU-кодер H.264, если он доступен, иначе x264 или MPEG-4 (mp4v). Для NVENC нужны видеокарта NVIDIA и PyAV или ffmpeg.",
+        "tip_threads": "Сколько потоков CPU может использовать видеокодер (только программные кодеки).",
         "tip_size": "Размер выходного видео. Изображения масштабируются и при необходимости дополняются черными полями.",
         "tip_out": "Выберите, куда сохранить MP4.",
         "tip_cancel": "Остановить текущий рендер (безопасная отмена).",
@@ -280,6 +412,30 @@ I18N: Dict[str, Dict[str, str]] = {
 }
 
 
+def i18n_fields(text: str) -> Optional[frozenset]:
+    # Placeholder names used by a template, or None if it is not a valid format string
+    try:
+        return frozenset(name for _, name, _, _ in string.Formatter().parse(text) if name is not None)
+    except ValueError:
+        return None
+
+
+def resolve_lang(lang: str) -> Dict[str, str]:
+    # Complete key -> text table for `lang`. English fills missing keys and replaces
+    # templates whose placeholders differ from the English ones, so MainWindow.tr()
+    # is a single lookup and can format without guarding against broken strings.
+    en = I18N["en"]
+    table = dict(en)
+    for key, text in I18N.get(lang, {}).items():
+        if key not in en or i18n_fields(text) == i18n_fields(en[key]):
+            table[key] = text
+    return table
+
+
+# All languages resolved at import (a handful of small dicts), so switching is a lookup
+I18N_RESOLVED: Dict[str, Dict[str, str]] = {lang: resolve_lang(lang) for lang in LANGS}
+
+
 def pick_default_lang() -> str:
     # Try to match system locale to our supported languages
     loc = QLocale.system().name().lower()  # e.g., "de_de"
@@ -291,32 +447,733 @@ def pick_default_lang() -> str:
 
 # --------------------------- Helpers ---------------------------
 
+IS_WINDOWS = os.name == "nt"
+
+
 def norm_path(p: str) -> str:
-    return os.path.normcase(os.path.abspath(p))
+    # De-duplication key. Dialogs and drops deliver absolute paths, which only need
+    # normpath (no cwd / GetFullPathName lookup); case is folded on Windows only.
+    p = os.path.normpath(p) if os.path.isabs(p) else os.path.abspath(p)
+    return p.lower() if IS_WINDOWS else p
+
+
+def base_name(p: str) -> str:
+    # os.path.basename() as a plain rfind + slice (no fspath / splitdrive calls)
+    if IS_WINDOWS:
+        return p[max(p.rfind("\\"), p.rfind("/"), p.rfind(":")) + 1:]
+    return p[p.rfind("/") + 1:]
+
+
+def has_supported_ext(name: str) -> bool:
+    # One set lookup instead of trying every extension with endswith()
+    return os.path.splitext(name)[1].lower() in SUPPORTED_EXT_SET
 
 
 def collect_images_from_folder(folder: str) -> List[str]:
+    # scandir entries carry the file type from the directory listing, so (apart from
+    # symlinks) no extra stat per file is needed
     try:
-        names = sorted(os.listdir(folder))
-    except Exception:
+        with os.scandir(folder) as it:
+            entries = [e for e in it if has_supported_ext(e.name) and e.is_file()]
+    except OSError:
         return []
-    out: List[str] = []
-    for fname in names:
-        fp = os.path.join(folder, fname)
-        if os.path.isfile(fp) and fname.lower().endswith(SUPPORTED_EXTS):
-            out.append(fp)
-    return out
+    entries.sort(key=lambda e: e.name)
+    return [e.path for e in entries]
+
+
+# --------------------------- Frame decoding ---------------------------
+
+def pillow_build() -> str:
+    # Pillow-SIMD keeps the Pillow API but versions itself as X.Y.Z.postN
+    version = getattr(PIL, "__version__", "?")
+    return f"Pillow-SIMD {version}" if ".post" in version else f"Pillow {version}"
+
+
+def readahead(p: str) -> None:
+    # Hint only: let the kernel start reading the file while earlier frames decode
+    try:
+        fd = os.open(p, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        elif F_RDADVISE is not None:
+            size = min(os.fstat(fd).st_size, 0x7FFFFFFF)
+            fcntl.fcntl(fd, F_RDADVISE, struct.pack("qi4x", 0, size))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ReadAhead:
+    # Issues readahead() for paths[i + distance] on a small daemon thread as item i is
+    # queued for decoding, so slow disks / network shares overlap with decode + encode.
+    # Does nothing on platforms without a read-ahead hint (Windows).
+    def __init__(self, paths: List[str], distance: int = READAHEAD_FILES):
+        self._paths = paths
+        self._distance = distance
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread = None
+        if HAVE_READAHEAD and distance > 0:
+            for p in paths[:distance]:
+                self._queue.put(p)
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+
+    def _loop(self):
+        for p in iter(self._queue.get, None):
+            readahead(p)
+
+    def advance(self, i: int) -> None:
+        # Item i (0-based) was just queued for decoding
+        if self._thread is not None and i + self._distance < len(self._paths):
+            self._queue.put(self._paths[i + self._distance])
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread = None
+
+
+def exif_orientation(p: str) -> int:
+    # Only parses the header, pixel data is not decoded here
+    try:
+        with Image.open(p) as img:
+            if img.format == "PNG":
+                # getexif() on a PNG without an eXIf chunk ahead of the image data decodes
+                # the whole image looking for one; take only what the header had
+                raw = img.info.get("exif")
+                if not raw:
+                    return 1
+                exif = Image.Exif()
+                exif.load(raw)
+            else:
+                exif = img.getexif()
+            return int(exif.get(0x0112, 1))
+    except Exception:
+        return 1
+
+
+def apply_orientation(img: np.ndarray, orientation: int) -> np.ndarray:
+    # Same mapping as PIL.ImageOps.exif_transpose
+    if orientation == 2:
+        return cv2.flip(img, 1)
+    if orientation == 3:
+        return cv2.rotate(img, cv2.ROTATE_180)
+    if orientation == 4:
+        return cv2.flip(img, 0)
+    if orientation == 5:
+        return cv2.transpose(img)
+    if orientation == 6:
+        return cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE)
+    if orientation == 7:
+        return cv2.flip(cv2.transpose(img), -1)
+    if orientation == 8:
+        return cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE)
+    return img
+
+
+def flatten_alpha(img: np.ndarray, code: int = cv2.COLOR_BGRA2BGR) -> np.ndarray:
+    # Compositing on black is the same as premultiplying by alpha. Premultiply in
+    # place when the array is ours, then one pass drops alpha (and swaps channels
+    # if asked), instead of widening the whole image to uint16 twice.
+    dst = img if img.flags.writeable else None
+    img = cv2.cvtColor(img, cv2.COLOR_RGBA2mRGBA, dst=dst)
+    return cv2.cvtColor(img, code)
+
+
+def alloc_frame(width: int, height: int) -> np.ndarray:
+    # A (height, width, 3) BGR frame whose start address and row stride are multiples of
+    # FRAME_ALIGN. OpenCV's FFmpeg writer copies every frame that is not aligned like
+    # this into a staging buffer first; PyAV and cv2 handle the padded rows natively.
+    stride = -(-width * 3 // FRAME_ALIGN) * FRAME_ALIGN
+    raw = np.zeros(height * stride + FRAME_ALIGN, np.uint8)
+    offset = -raw.ctypes.data % FRAME_ALIGN
+    rows = raw[offset:offset + height * stride].reshape(height, stride)
+    return rows[:, :width * 3].reshape(height, width, 3)
+
+
+def clear_letterbox(frame: np.ndarray, new_w: int, new_h: int, x: int, y: int) -> None:
+    # Buffers are reused, so blank everything around the image region
+    # (cheaper than clearing the whole frame; empty slices are no-ops)
+    frame[:y] = 0
+    frame[y + new_h:] = 0
+    frame[y:y + new_h, :x] = 0
+    frame[y:y + new_h, x + new_w:] = 0
+
+
+def reduce_factor(size: Tuple[int, int], target: Optional[Tuple[int, int]]) -> int:
+    # Integer box-reduction factor that still leaves >= 2x the target size for Lanczos
+    if target is None:
+        return 1
+    return max(1, int(min(size[0] / target[0], size[1] / target[1]) // 2))
+
+
+def decode_bgr_pil(p: str, target: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    # Fallback for files OpenCV cannot decode (GIF on older builds, some WebP variants, ...)
+    img = Image.open(p)
+    # Only read the orientation tag here; exif_transpose() would copy the whole image
+    # even for the usual orientation 1. The flip/rotate is applied last, after reduction.
+    try:
+        orientation = int(img.getexif().get(0x0112, 1))
+    except Exception:
+        orientation = 1
+
+    # Only images that can actually be transparent pay for an RGBA conversion
+    # Premultiplied ("RGBa") is the composite on black, so alpha can simply be dropped
+    # later; it also keeps transparent pixels from bleeding into the box reduction.
+    if img.mode in PIL_ALPHA_MODES or "transparency" in img.info:
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        img = img.convert("RGBa")
+    elif img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
+    shown_size = img.size[::-1] if orientation in (5, 6, 7, 8) else img.size
+    factor = reduce_factor(shown_size, target)
+    if factor > 1:
+        # Cheap box reduction first, so the final Lanczos pass filters far fewer pixels
+        img = img.reduce(factor)
+
+    arr = np.asarray(img)
+    if img.mode == "L":
+        out = arr
+    elif img.mode == "RGB":
+        out = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+    else:
+        # Drop alpha and swap to BGR in one pass
+        out = cv2.cvtColor(arr, cv2.COLOR_RGBA2BGR)
+    return apply_orientation(out, orientation)
+
+
+# (scale, color flag, grayscale flag) for libjpeg's DCT-domain downscaling, largest first
+JPEG_REDUCED_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+
+
+def jpeg_read_flag(p: str, target: Optional[Tuple[int, int]]) -> int:
+    # JPEGs much larger than the output are decoded at 1/2, 1/4 or 1/8 scale: libjpeg
+    # skips most of the IDCT work and the final resize filters far fewer pixels.
+    # Size, mode and orientation come from the header (no pixel decode).
+    if target is None:
+        return cv2.IMREAD_ANYCOLOR
+    try:
+        with Image.open(p) as img:
+            size, gray = img.size, img.mode == "L"
+            if img.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+                size = size[::-1]  # shown rotated by 90 degrees
+    except Exception:
+        return cv2.IMREAD_ANYCOLOR
+    factor = reduce_factor(size, target)
+    for scale, color_flag, gray_flag in JPEG_REDUCED_FLAGS:
+        if factor >= scale:
+            return gray_flag if gray else color_flag
+    return cv2.IMREAD_ANYCOLOR
+
+
+def decode_bgr(p: str, target: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    # Returns BGR, or a 2-D array for grayscale sources.
+    # np.fromfile + imdecode instead of cv2.imread so non-ASCII paths work on Windows
+    name = p.lower()
+    opaque = name.endswith(OPAQUE_EXTS)
+    data = np.fromfile(p, dtype=np.uint8)
+    if not data.size:
+        img = None
+    elif opaque:
+        # No alpha possible: decode straight to 8-bit gray/BGR, EXIF orientation applied by OpenCV
+        img = cv2.imdecode(data, jpeg_read_flag(p, target))
+    else:
+        img = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+    if img is None:
+        return decode_bgr_pil(p, target)
+    if opaque:
+        return img
+
+    if img.dtype == np.uint16:
+        img = (img >> 8).astype(np.uint8)
+    elif img.dtype != np.uint8:
+        return decode_bgr_pil(p, target)
+
+    # Grayscale stays single-channel here; it is expanded to BGR when letterboxed
+    if img.ndim == 3 and img.shape[2] == 4:
+        img = flatten_alpha(img)
+    elif img.ndim == 3 and img.shape[2] != 3:
+        return decode_bgr_pil(p, target)
+
+    # IMREAD_UNCHANGED ignores EXIF orientation, so apply it ourselves
+    # (except for TIFF on builds whose TIFF decoder already does)
+    if name.endswith(NO_EXIF_EXTS) or (name.endswith(TIFF_EXTS) and cv2_orients_tiff()):
+        return img
+    return apply_orientation(img, exif_orientation(p))
+
+
+@lru_cache(maxsize=None)
+def cv2_orients_tiff() -> bool:
+    # Probed once: a 2x1 TIFF tagged "rotate 90" comes back 1 wide if OpenCV rotated it
+    buf = io.BytesIO()
+    img = Image.new("RGB", (2, 1))
+    exif = img.getexif()
+    exif[0x0112] = 6
+    img.save(buf, format="TIFF", exif=exif)
+    try:
+        out = cv2.imdecode(np.frombuffer(buf.getvalue(), np.uint8), cv2.IMREAD_UNCHANGED)
+    except cv2.error:
+        return False
+    return out is not None and out.shape[:2] == (2, 1)
+
+
+@lru_cache(maxsize=None)
+def pil_decoded_exts() -> Tuple[str, ...]:
+    # Recent OpenCV builds read GIF themselves; probed once with a tiny in-memory GIF
+    buf = io.BytesIO()
+    Image.new("P", (2, 2)).save(buf, format="GIF")
+    try:
+        ok = cv2.imdecode(np.frombuffer(buf.getvalue(), np.uint8), cv2.IMREAD_UNCHANGED) is not None
+    except cv2.error:
+        ok = False
+    return () if ok else PIL_DECODED_EXTS
+
+
+@lru_cache(maxsize=None)
+def cuda_available() -> bool:
+    # Probed once; regular opencv-python wheels have the cv2.cuda module but no devices
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+def resize_cuda(img: np.ndarray, size: Tuple[int, int], interp: int) -> np.ndarray:
+    gpu = cv2.cuda_GpuMat()
+    gpu.upload(img)
+    # cv2.cuda.resize has no Lanczos; bicubic is the closest filter it offers
+    if interp != cv2.INTER_AREA:
+        interp = cv2.INTER_CUBIC
+    return cv2.cuda.resize(gpu, size, interpolation=interp).download()
+
+
+class FrameRenderer:
+    # Decodes an image and letterboxes it into a target-sized BGR frame
+    def __init__(self, width: int, height: int, use_cuda: Optional[bool] = None):
+        self.width = width
+        self.height = height
+        self.use_cuda = cuda_available() if use_cuda is None else use_cuda
+        # (src_w, src_h) -> (new_w, new_h, paste_x, paste_y, interpolation);
+        # frame dumps usually share one size
+        self._resize_cache: Dict[Tuple[int, int], Tuple[int, int, int, int, int]] = {}
+
+    def fit(self, img_w: int, img_h: int) -> Tuple[int, int, int, int, int]:
+        layout = self._resize_cache.get((img_w, img_h))
+        if layout is None:
+            target_w, target_h = self.width, self.height
+            img_w, img_h = max(1, img_w), max(1, img_h)
+
+            # Scale to fit while preserving aspect ratio (integer math, rounded half up).
+            # The bound side is taken as the target exactly; the other one is scaled.
+            if img_w * target_h <= img_h * target_w:
+                src, dst = img_h, target_h
+                new_w = max(1, (2 * img_w * target_h + img_h) // (2 * img_h))
+                new_h = target_h
+            else:
+                src, dst = img_w, target_w
+                new_w = target_w
+                new_h = max(1, (2 * img_h * target_w + img_w) // (2 * img_w))
+
+            # Lanczos for moderate scaling; for strong downscales (scale < 0.5) the
+            # area filter is several times faster and aliases less
+            interp = cv2.INTER_AREA if 2 * dst < src else cv2.INTER_LANCZOS4
+
+            # Center on black background
+            layout = (new_w, new_h, (target_w - new_w) // 2, (target_h - new_h) // 2, interp)
+            self._resize_cache[(img_w, img_h)] = layout
+        return layout
+
+    def render(self, p: str, frame: np.ndarray) -> Optional[np.ndarray]:
+        # Returns the array to encode (normally `frame`), or None if the image could not be opened
+        try:
+            img = decode_bgr(p, (self.width, self.height))
+        except Exception:
+            return None
+
+        img_h, img_w = img.shape[:2]
+        gray = img.ndim == 2
+        if img_w == self.width and img_h == self.height:
+            # Already the target size (typical for frame dumps): no resize, no letterbox copy
+            if gray:
+                return cv2.cvtColor(img, cv2.COLOR_GRAY2BGR, dst=frame)
+            return img
+
+        new_w, new_h, paste_x, paste_y, interp = self.fit(img_w, img_h)
+        clear_letterbox(frame, new_w, new_h, paste_x, paste_y)
+
+        # Resize straight into the letterbox region of the black frame,
+        # so there is no intermediate resized image to copy over
+        region = frame[paste_y:paste_y + new_h, paste_x:paste_x + new_w]
+        small = None
+        if self.use_cuda and img_w * img_h >= CUDA_MIN_PIXELS:
+            # Large sources: the resample dominates, so it is worth the upload/download
+            try:
+                small = resize_cuda(img, (new_w, new_h), interp)
+            except cv2.error:
+                self.use_cuda = False  # broken driver / context: stay on the CPU from now on
+
+        if small is None:
+            if not gray:
+                cv2.resize(img, (new_w, new_h), dst=region, interpolation=interp)
+                return frame
+            # Resize one channel instead of three, expand to BGR while pasting
+            small = cv2.resize(img, (new_w, new_h), interpolation=interp)
+
+        if gray:
+            cv2.cvtColor(small, cv2.COLOR_GRAY2BGR, dst=region)
+        else:
+            np.copyto(region, small)
+        return frame
+
+
+def shared_frames(buf, count: int, width: int, height: int) -> np.ndarray:
+    # `count` BGR frames laid out in a shared memory block, each starting on FRAME_ALIGN
+    slot = -(-width * height * 3 // FRAME_ALIGN) * FRAME_ALIGN
+    return np.ndarray((count, height, width, 3), np.uint8, buf, strides=(slot, width * 3, 3, 1))
+
+
+def shared_frames_size(count: int, width: int, height: int) -> int:
+    return count * -(-width * height * 3 // FRAME_ALIGN) * FRAME_ALIGN
+
+
+# Per-process state for the multiprocessing decode path: a renderer plus the
+# parent's ring of frame slots, which workers render into directly
+_process_renderer: Optional[FrameRenderer] = None
+_process_shm: Optional[shared_memory.SharedMemory] = None
+_process_slots: Optional[np.ndarray] = None
+
+
+def init_process_renderer(shm_name: str, count: int, width: int, height: int) -> None:
+    global _process_renderer, _process_shm, _process_slots
+    # No CUDA in pool processes: each would set up its own context next to the parent's
+    _process_renderer = FrameRenderer(width, height, use_cuda=False)
+    _process_shm = shared_memory.SharedMemory(name=shm_name)
+    _process_slots = shared_frames(_process_shm.buf, count, width, height)
+
+
+def render_in_process(p: str, slot: int) -> bool:
+    # Only the slot number and a success flag cross the process boundary
+    frame = _process_slots[slot]
+    out = _process_renderer.render(p, frame)
+    if out is None:
+        return False
+    if out is not frame:
+        np.copyto(frame, out)
+    return True
+
+
+# --------------------------- Video writers ---------------------------
+
+class AvWriter:
+    # Small cv2.VideoWriter look-alike on top of PyAV, so run() does not care which one it got
+    def __init__(self, path: str, fps: Fraction, size: Tuple[int, int], encoders: Tuple[str, ...] = AV_ENCODERS,
+                 threads: int = 0):
+        self.codec: Optional[str] = None
+        self._container = None
+        self._stream = None
+
+        width, height = size
+        for name in encoders:
+            if name not in av.codecs_available:
+                continue
+            container = av.open(path, "w")
+            try:
+                stream = container.add_stream(name, rate=fps)
+                stream.width = width
+                stream.height = height
+                stream.pix_fmt = "yuv420p"
+                stream.codec_context.thread_count = threads  # 0 = let FFmpeg decide
+                # Listed encoders may still be unusable (no GPU / driver), so open eagerly
+                stream.codec_context.open()
+            except Exception:
+                container.close()
+                continue
+            self.codec = name
+            self._container = container
+            self._stream = stream
+            break
+
+    def isOpened(self) -> bool:
+        return self._stream is not None
+
+    def write(self, frame: np.ndarray) -> None:
+        # Wrap the caller's buffer instead of copying it (from_ndarray would). Safe because
+        # encode() converts to yuv420p into a new frame before this call returns.
+        if hasattr(av.VideoFrame, "from_numpy_buffer"):
+            vf = av.VideoFrame.from_numpy_buffer(frame, format="bgr24")
+        else:
+            vf = av.VideoFrame.from_ndarray(frame, format="bgr24")
+        for packet in self._stream.encode(vf):
+            self._container.mux(packet)
+
+    def release(self) -> None:
+        if self._stream is None:
+            return
+        for packet in self._stream.encode():
+            self._container.mux(packet)
+        self._container.close()
+        self._stream = None
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_encoders() -> frozenset:
+    # Encoder names of the ffmpeg on PATH (empty when there is none)
+    exe = shutil.which("ffmpeg")
+    if exe is None:
+        return frozenset()
+    try:
+        out = subprocess.run(
+            [exe, "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10, creationflags=NO_WINDOW
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+    # Lines look like " V....D libx264    libx264 H.264 / AVC / MPEG-4 AVC ...",
+    # after a legend of " V..... = Video" lines
+    return frozenset(
+        parts[1] for parts in map(str.split, out.splitlines())
+        if len(parts) > 1 and len(parts[0]) == 6 and parts[1] != "="
+    )
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_encoder_works(codec: str) -> bool:
+    # ffmpeg lists NVENC even without a GPU, so encode one small black frame to find
+    # out whether the encoder can actually be opened (once per session and codec)
+    exe = shutil.which("ffmpeg")
+    if exe is None:
+        return False
+    cmd = [
+        exe, "-hide_banner", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", "256x256", "-r", "25", "-i", "-",
+        "-frames:v", "1", "-c:v", codec, "-pix_fmt", "yuv420p", "-f", "null", "-",
+    ]
+    try:
+        result = subprocess.run(
+            cmd, input=bytes(256 * 256 * 3), capture_output=True, timeout=20, creationflags=NO_WINDOW
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+class FfmpegWriter:
+    # cv2.VideoWriter look-alike that pipes raw BGR frames into an ffmpeg process,
+    # for encoders (NVENC, x264) when PyAV is not installed
+    def __init__(self, path: str, fps: Fraction, size: Tuple[int, int], codec: str, threads: int = 0):
+        width, height = size
+        cmd = [
+            shutil.which("ffmpeg") or "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}",
+            "-r", f"{fps.numerator}/{fps.denominator}", "-i", "-",
+            "-c:v", codec, "-pix_fmt", "yuv420p", "-threads", str(threads),
+        ]
+        if codec.endswith("_nvenc"):
+            cmd += ["-preset", "p5"]
+        elif codec == "libx264":
+            cmd += ["-preset", "veryfast"]
+        cmd.append(path)
+
+        self.codec = codec
+        # ffmpeg's error output goes to a temporary file (a pipe nobody reads could fill
+        # up and stall it); its tail ends up in the error message if ffmpeg fails
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            # Unbuffered: whole frames go straight to the pipe instead of through a copy
+            self._proc = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stderr=self._stderr, bufsize=0, creationflags=NO_WINDOW,
+            )
+        except OSError:
+            self._proc = None
+            self._stderr.close()
+
+    def isOpened(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def write(self, frame: np.ndarray) -> None:
+        # Contiguous frames (row size already a multiple of FRAME_ALIGN, or passed through
+        # unscaled) are written from their own memory; padded ones need a packed copy
+        data = memoryview(frame).cast("B") if frame.flags.c_contiguous else memoryview(frame.tobytes())
+        while data:
+            data = data[self._proc.stdin.write(data):]
+
+    def release(self) -> None:
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        with self._stderr:
+            if proc.wait() == 0:
+                return
+            self._stderr.seek(0)
+            tail = self._stderr.read().decode("utf-8", "replace").strip()[-FFMPEG_ERROR_TAIL:]
+        msg = f"ffmpeg ({self.codec}) exited with code {proc.returncode}"
+        raise RuntimeError(f"{msg}:\n{tail}" if tail else msg)
+
+
+class ThreadedWriter:
+    # Runs writer.write() on a background thread so decoding can continue while a frame
+    # encodes. `done` callbacks fire on that thread once the frame has been consumed.
+    # Once `cancel` is set, queued frames are dropped instead of encoded.
+    def __init__(self, writer, maxsize: int = WRITE_QUEUE_SIZE, cancel: Optional[threading.Event] = None):
+        self._writer = writer
+        self._cancel = cancel or threading.Event()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        for frame, done in iter(self._queue.get, None):
+            if self._error is None and not self._cancel.is_set():
+                try:
+                    self._writer.write(frame)
+                except Exception as e:
+                    self._error = e
+            if done is not None:
+                done()
+
+    def isOpened(self) -> bool:
+        return self._writer.isOpened()
+
+    def write(self, frame: np.ndarray, done: Optional[Callable[[], None]] = None) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put((frame, done))
+
+    def release(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self._writer.release()
+        if self._error is not None:
+            raise self._error
+
+
+def open_writer(path: str, interval_ms: int, size: Tuple[int, int], repeats: int = 1, codec: str = "auto",
+                threads: int = 0):
+    # Each image is written `repeats` times, so one image still lasts interval_ms.
+    # `threads` is the encoder thread count (0 = automatic).
+    interval_ms = max(1, interval_ms)
+    repeats = max(1, repeats)
+    fps = Fraction(1000 * repeats, interval_ms)
+    width, height = size
+
+    # yuv420p needs even dimensions; otherwise stay on the OpenCV writer.
+    # An encoder that is not available falls back to mp4v rather than failing.
+    if codec != "mp4v" and width % 2 == 0 and height % 2 == 0:
+        if av is not None:
+            writer = AvWriter(path, fps, size, AV_ENCODERS if codec == "auto" else (codec,), threads)
+            if writer.isOpened():
+                return writer
+        # Without PyAV, "auto" uses x264 through ffmpeg (encoding then runs in its own
+        # process); NVENC is only used on request, and only after a probe encode
+        pipe_codec = "libx264" if codec == "auto" else codec
+        if pipe_codec in ffmpeg_encoders() and ffmpeg_encoder_works(pipe_codec):
+            writer = FfmpegWriter(path, fps, size, pipe_codec, threads)
+            if writer.isOpened():
+                return writer
+
+    # Read by OpenCV's FFmpeg backend when the writer is created
+    os.environ["OPENCV_FFMPEG_WRITER_OPTIONS"] = f"threads;{threads}"
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    return cv2.VideoWriter(path, fourcc, float(fps), size)
 
 
 # --------------------------- Widgets ---------------------------
 
-class ImageListWidget(QListWidget):
+class PathListModel(QAbstractListModel):
+    # The image list as a plain List[str]: no per-row item objects, and the worker
+    # can take a copy of the list directly
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paths: List[str] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self.paths[index.row()]
+        return None
+
+    def flags(self, index):
+        # Rows can be dragged and dropped between, but not onto each other
+        if index.isValid():
+            return super().flags(index) | Qt.ItemIsDragEnabled
+        return super().flags(index) | Qt.ItemIsDropEnabled
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def append(self, paths: List[str]) -> None:
+        if not paths:
+            return
+        first = len(self.paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self.paths.extend(paths)
+        self.endInsertRows()
+
+    def remove_rows(self, rows: List[int]) -> None:
+        # Bottom-up, one removal per contiguous run of rows
+        rows = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.paths[first:last + 1]
+            self.endRemoveRows()
+            i += 1
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.paths.clear()
+        self.endResetModel()
+
+    def move_rows(self, rows: List[int], dest: int) -> None:
+        # Moves `rows` in front of row `dest`, keeping their order; the selection
+        # (persistent indexes) follows the moved rows
+        moving = set(rows)
+        if not moving:
+            return
+        order = [r for r in range(dest) if r not in moving] + sorted(moving)
+        order += [r for r in range(dest, len(self.paths)) if r not in moving]
+        new_row = {old: new for new, old in enumerate(order)}
+
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [self.index(new_row[i.row()]) for i in old_indexes])
+        self.paths = [self.paths[r] for r in order]
+        self.layoutChanged.emit()
+
+
+class ImageListView(QListView):
     def __init__(self, main_window: "MainWindow"):
         super().__init__(main_window)
         self._main = main_window
+        self.path_model = PathListModel(self)
+        self.setModel(self.path_model)
+        # All rows are one line of text; lets the view skip measuring every row
+        self.setUniformItemSizes(True)
         self.setAcceptDrops(True)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setDragDropMode(QAbstractItemView.InternalMove)
+        self.setDefaultDropAction(Qt.MoveAction)
+        self.setDropIndicatorShown(True)
 
     def dragEnterEvent(self, e):
         if e.mimeData().hasUrls():
@@ -324,38 +1181,183 @@ class ImageListWidget(QListWidget):
         else:
             super().dragEnterEvent(e)
 
-    def dropEvent(self, e):
+    def dragMoveEvent(self, e):
         if e.mimeData().hasUrls():
-            paths: List[str] = []
-            for url in e.mimeData().urls():
-                p = url.toLocalFile()
-                if not p:
-                    continue
-                if os.path.isdir(p):
-                    paths.extend(collect_images_from_folder(p))
-                elif p.lower().endswith(SUPPORTED_EXTS) and os.path.isfile(p):
-                    paths.append(p)
+            e.acceptProposedAction()
+        else:
+            super().dragMoveEvent(e)
 
+    def dropEvent(self, e):
+        if e.mimeData().hasUrls():
+            paths = [p for p in (url.toLocalFile() for url in e.mimeData().urls()) if p]
             if paths:
-                self._main.add_images(paths)
+                # Folder listing / stat calls happen on a background thread
+                self._main.scan_paths(paths)
             e.acceptProposedAction()
+        elif e.source() is self:
+            # Reorder within the list
+            index = self.indexAt(e.pos())
+            if not index.isValid():
+                dest = self.path_model.rowCount()
+            elif self.dropIndicatorPosition() == QAbstractItemView.BelowItem:
+                dest = index.row() + 1
+            else:
+                dest = index.row()
+            self.path_model.move_rows([i.row() for i in self.selectionModel().selectedRows()], dest)
+            # Reported as a copy, otherwise the drag source would also delete the rows
+            e.setDropAction(Qt.CopyAction)
+            e.accept()
         else:
             super().dropEvent(e)
 
 
+class PathScanner(QThread):
+    # Expands dropped folders and checks dropped files off the GUI thread, so large
+    # drops (or slow network shares) do not freeze the window
+    found = pyqtSignal(list)                     # existing image files, in drop order
+
+    def __init__(self, paths: List[str], parent=None):
+        super().__init__(parent)
+        self.paths = paths
+
+    def run(self):
+        files: List[str] = []
+        for p in self.paths:
+            if os.path.isdir(p):
+                files.extend(collect_images_from_folder(p))
+            elif has_supported_ext(p) and os.path.isfile(p):
+                files.append(p)
+        self.found.emit(files)
+
+
 class VideoWorker(QThread):
     progress = pyqtSignal(int)                   # 0..100
     step = pyqtSignal(int, int, str)             # idx, total, path
     finished = pyqtSignal(bool, str, str)        # ok, code, detail
 
-    def __init__(self, image_paths: List[str], out_path: str, width: int, height: int, interval_ms: int):
+    def __init__(self, image_paths: List[str], out_path: str, width: int, height: int, interval_ms: int,
+                 repeats: int = 1, codec: str = "auto", threads: int = 0):
         super().__init__()
         self.skipped: List[str] = []
+        # File names of the first SKIPPED_EXAMPLES skipped images, for the completion
+        # dialog (computed here rather than in the GUI thread's finish handler)
+        self.skipped_basenames: List[str] = []
+        # The same names, newline-joined once the run is over
+        self.skipped_examples = ""
         self.image_paths = image_paths
         self.out_path = out_path
         self.width = width
         self.height = height
         self.interval_ms = interval_ms
+        self.repeats = max(1, repeats)
+        self.codec = codec
+        self.threads = threads
+        self._renderer = FrameRenderer(width, height)
+        # Shared with the decode and encode threads so they stop picking up work on cancel
+        self._cancel = threading.Event()
+
+    def requestInterruption(self):
+        self._cancel.set()
+        super().requestInterruption()
+
+    def _render(self, p: str, frame: np.ndarray) -> Optional[np.ndarray]:
+        if self._cancel.is_set():
+            return None
+        return self._renderer.render(p, frame)
+
+    def _prefetch_window(self, workers: int) -> int:
+        frame_bytes = self.width * self.height * 3
+        return max(2, min(workers * 2, PREFETCH_BYTES // frame_bytes))
+
+    def _use_processes(self) -> bool:
+        total = len(self.image_paths)
+        exts = pil_decoded_exts()
+        if not exts or (os.cpu_count() or 1) < 2 or total < PROCESS_POOL_MIN_FRAMES:
+            return False
+        pil_decoded = sum(1 for p in self.image_paths if p.lower().endswith(exts))
+        return pil_decoded * 2 > total
+
+    def _ordered_frames(self, pool, free: queue.Queue, render: Callable, view: Callable):
+        # Submits paths to `pool` in list order, one per free buffer token, and yields
+        # (idx, path, frame or None, release) in that same order. `render(path, token)`
+        # runs in the pool; `view(token, result)` turns its result into the frame to
+        # encode. A token goes back to `free` when the caller invokes `release`.
+        pending = deque()
+        todo = enumerate(self.image_paths, start=1)
+        nxt = next(todo, None)
+        ahead = ReadAhead(self.image_paths)
+        try:
+            while True:
+                while nxt is not None:
+                    # Only wait for a buffer when nothing is pending, otherwise
+                    # hand out what is ready so the encoder can return buffers
+                    try:
+                        token = free.get(block=not pending)
+                    except queue.Empty:
+                        break
+                    pending.append((nxt[0], nxt[1], token, pool.submit(render, nxt[1], token)))
+                    ahead.advance(nxt[0] - 1)
+                    nxt = next(todo, None)
+                if not pending:
+                    return
+
+                idx, p, token, fut = pending.popleft()
+                yield idx, p, view(token, fut.result()), partial(free.put, token)
+        finally:
+            for *_, fut in pending:
+                fut.cancel()
+            ahead.close()
+
+    def _frames_threaded(self):
+        # Decode/resize runs ahead in a thread pool (OpenCV releases the GIL) while
+        # the caller encodes. Frames in flight are bounded by a fixed set of reused buffers.
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        window = self._prefetch_window(workers)
+        free: "queue.Queue[np.ndarray]" = queue.Queue()
+        for _ in range(window):
+            free.put(alloc_frame(self.width, self.height))
+
+        pool = ThreadPoolExecutor(max_workers=min(workers, window))
+        try:
+            yield from self._ordered_frames(pool, free, self._render, lambda frame, out: out)
+        finally:
+            pool.shutdown(wait=True)
+
+    def _frames_multiprocess(self):
+        # Same contract as _frames_threaded, but decoding happens in worker processes
+        # (for Pillow-decoded formats that keep the GIL busy). Workers render into a ring
+        # of frame slots in shared memory owned by this process, so frames are never
+        # pickled; only paths, slot numbers and a success flag are.
+        # More workers than slots would only wait for a free slot, so PREFETCH_BYTES
+        # caps the worker count as well
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        window = self._prefetch_window(workers)
+        workers = min(workers, window)
+        shm = shared_memory.SharedMemory(create=True, size=shared_frames_size(window, self.width, self.height))
+        slots = shared_frames(shm.buf, window, self.width, self.height)
+        free: "queue.Queue[int]" = queue.Queue()
+        for i in range(window):
+            free.put(i)
+
+        # Spawned, not forked: forking this process (Qt, encoder and read-ahead threads
+        # running) can leave a child stuck on a lock some other thread held
+        pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_process_renderer,
+            initargs=(shm.name, window, self.width, self.height),
+        )
+        try:
+            yield from self._ordered_frames(
+                pool, free, render_in_process, lambda slot, ok: slots[slot] if ok else None
+            )
+        finally:
+            pool.shutdown(wait=True)
+            del slots
+            try:
+                shm.close()
+            except BufferError:
+                pass  # the caller still holds a frame view; the mapping goes away with it
+            shm.unlink()
 
     def run(self):
         try:
@@ -363,55 +1365,73 @@ class VideoWorker(QThread):
                 self.finished.emit(False, "no_images", "")
                 return
 
-            fps = 1000.0 / max(1, self.interval_ms)
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            writer = cv2.VideoWriter(self.out_path, fourcc, fps, (self.width, self.height))
+            writer = open_writer(self.out_path, self.interval_ms, (self.width, self.height), self.repeats, self.codec, self.threads)
             if not writer.isOpened():
                 self.finished.emit(False, "writer_open_failed", "")
                 return
 
             total = len(self.image_paths)
             processed = 0
+            # Cross-thread signals are not free: report progress only when the percentage
+            # changes and the status line at most once per PROGRESS_INTERVAL_S (the last
+            # image and the final 100 % always go out)
+            last_pct = -1
+            last_emit = 0.0
+            last_step = 0.0
+            cancelled = False
+
+            # Encoding runs on its own thread, so this one keeps collecting frames
+            sink = ThreadedWriter(writer, cancel=self._cancel)
+            frames = self._frames_multiprocess() if self._use_processes() else self._frames_threaded()
+            try:
+                for idx, p, out, release in frames:
+                    if self._cancel.is_set():
+                        release()
+                        cancelled = True
+                        break
+
+                    now = time.monotonic()
+                    if idx == total or now - last_step >= PROGRESS_INTERVAL_S:
+                        self.step.emit(idx, total, p)
+                        last_step = now
+
+                    if out is not None:
+                        # Decoded once, written `repeats` times; the buffer goes back
+                        # to the decoder after the last copy is encoded
+                        for _ in range(self.repeats - 1):
+                            sink.write(out)
+                        sink.write(out, release)
+                    elif self._cancel.is_set():
+                        # _render gives up on cancel; that is not a file that failed to open
+                        release()
+                        cancelled = True
+                        break
+                    else:
+                        self.skipped.append(p)
+                        if len(self.skipped_basenames) < SKIPPED_EXAMPLES:
+                            self.skipped_basenames.append(base_name(p))
+                        release()
 
-            for idx, p in enumerate(self.image_paths, start=1):
-                if self.isInterruptionRequested():
-                    writer.release()
-                    self.finished.emit(False, "cancelled", "")
-                    return
-
-                self.step.emit(idx, total, p)
-
-                try:
-                    img = ImageOps.exif_transpose(Image.open(p)).convert("RGBA")
-                except Exception as e:
-                    self.skipped.append(p)
                     processed += 1
-                    self.progress.emit(int(processed / total * 100))
-                    continue
-
-                img_w, img_h = img.size
-                target_w, target_h = self.width, self.height
-
-                # Scale to fit while preserving aspect ratio
-                scale = min(target_w / max(1, img_w), target_h / max(1, img_h))
-                new_w = max(1, int(round(img_w * scale)))
-                new_h = max(1, int(round(img_h * scale)))
-
-                resized = img.resize((new_w, new_h), resample=Image.LANCZOS)
-
-                # Composite on black background and center
-                background = Image.new("RGB", (target_w, target_h), (0, 0, 0))
-                paste_x = (target_w - new_w) // 2
-                paste_y = (target_h - new_h) // 2
-                background.paste(resized, (paste_x, paste_y), resized)
-
-                frame = cv2.cvtColor(np.array(background), cv2.COLOR_RGB2BGR)
-                writer.write(frame)
-
-                processed += 1
-                self.progress.emit(int(processed / total * 100))
-
-            writer.release()
+                    pct = processed * 100 // total
+                    if pct != last_pct:
+                        if pct == 100 or now - last_emit >= PROGRESS_INTERVAL_S:
+                            self.progress.emit(pct)
+                            last_pct = pct
+                            last_emit = now
+            finally:
+                # Writer first: queued frames may still point into the frame source's buffers
+                try:
+                    sink.release()
+                finally:
+                    frames.close()
+
+            # A cancel after the last image was queued still drops the frames the
+            # encoder had not reached yet, so the file is incomplete either way
+            if cancelled or self._cancel.is_set():
+                self.finished.emit(False, "cancelled", "")
+                return
+            self.skipped_examples = "\n".join(self.skipped_basenames)
             self.finished.emit(True, "done", self.out_path)
         except Exception as e:
             self.finished.emit(False, "error", str(e))
@@ -424,22 +1444,40 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self.lang: str = pick_default_lang()
-        self._t = I18N[self.lang]
+        self._t = I18N_RESOLVED[self.lang]
 
         self.out_path: Optional[str] = None
         self.worker: Optional[VideoWorker] = None
+        # norm_path() of every list entry, kept in sync with the list for de-duplication
+        self._known: set = set()
+        # Running PathScanner threads (kept referenced until they finish)
+        self._scanners: set = set()
+        # "Creating video…" in the current language, fixed for the duration of a run
+        self._status_prefix = ""
+        self.settings = QSettings("zeittresor", "images_to_mp4")
 
         self._build_ui()
         self.apply_language(self.lang)
 
+        # Completion dialogs are built once and reused for every run
+        self._info_box = self._make_box(QMessageBox.Information)
+        self._error_box = self._make_box(QMessageBox.Critical)
+        # Probed once: with a system tray that can show messages, a finished run in the
+        # background is announced as a desktop notification instead of a modal dialog
+        self._use_native_toast = QSystemTrayIcon.isSystemTrayAvailable() and QSystemTrayIcon.supportsMessages()
+        self._tray: Optional[QSystemTrayIcon] = None
+
+        # Worker result code -> handler; anything else is reported as an error
+        self._finish_handlers = {
+            "done": self._finish_done,
+            "cancelled": self._finish_cancelled,
+            "writer_open_failed": self._finish_writer_failed,
+        }
+
     def tr(self, key: str, **kwargs) -> str:
-        text = self._t.get(key, I18N["en"].get(key, key))
-        if kwargs:
-            try:
-                return text.format(**kwargs)
-            except Exception:
-                return text
-        return text
+        text = self._t.get(key, key)
+        # format_map uses the kwargs dict as is instead of unpacking it again
+        return text.format_map(kwargs) if kwargs else text
 
     def _build_ui(self):
         self.setWindowTitle(self.tr("title"))
@@ -451,9 +1489,9 @@ class MainWindow(QMainWindow):
         central.setLayout(root)
 
         # Image list
-        self.list_widget = ImageListWidget(self)
-        self.list_widget.setToolTip(self.tr("tip_list"))
-        root.addWidget(self.list_widget, 1)
+        self.list_view = ImageListView(self)
+        self.list_view.setToolTip(self.tr("tip_list"))
+        root.addWidget(self.list_view, 1)
 
         # Buttons row
         row_buttons = QHBoxLayout()
@@ -488,6 +1526,21 @@ class MainWindow(QMainWindow):
         self.spin_interval.setValue(40)
         self.spin_interval.setToolTip(self.tr("tip_interval"))
 
+        self.spin_repeats = QSpinBox()
+        self.spin_repeats.setRange(1, 1000)
+        self.spin_repeats.setValue(1)
+        self.spin_repeats.setToolTip(self.tr("tip_repeats"))
+
+        self.combo_codec = QComboBox()
+        for codec in CODECS:
+            self.combo_codec.addItem(codec, codec)
+        self.combo_codec.setToolTip(self.tr("tip_codec"))
+
+        self.spin_threads = QSpinBox()
+        self.spin_threads.setRange(1, max(64, os.cpu_count() or 1))
+        self.spin_threads.setValue(os.cpu_count() or 1)
+        self.spin_threads.setToolTip(self.tr("tip_threads"))
+
         self.spin_width = QSpinBox()
         self.spin_width.setRange(1, 8192)
         self.spin_width.setValue(512)
@@ -499,13 +1552,24 @@ class MainWindow(QMainWindow):
         self.spin_height.setToolTip(self.tr("tip_size"))
 
         self.lbl_interval = QLabel()
+        self.lbl_repeats = QLabel()
+        self.lbl_codec = QLabel()
+        self.lbl_threads = QLabel()
         self.lbl_width = QLabel()
         self.lbl_height = QLabel()
 
         form.addRow(self.lbl_interval, self.spin_interval)
+        form.addRow(self.lbl_repeats, self.spin_repeats)
+        form.addRow(self.lbl_codec, self.combo_codec)
+        form.addRow(self.lbl_threads, self.spin_threads)
         form.addRow(self.lbl_width, self.spin_width)
         form.addRow(self.lbl_height, self.spin_height)
 
+        self.chk_done_dialog = QCheckBox()
+        self.chk_done_dialog.setChecked(self.settings.value("show_done_dialog", True, type=bool))
+        self.chk_done_dialog.toggled.connect(lambda on: self.settings.setValue("show_done_dialog", on))
+        form.addRow(self.chk_done_dialog)
+
         row_panels.addWidget(self.group_settings, 2)
 
         # Language group
@@ -586,7 +1650,7 @@ class MainWindow(QMainWindow):
         if lang not in LANGS:
             lang = "en"
         self.lang = lang
-        self._t = I18N.get(lang, I18N["en"])
+        self._t = I18N_RESOLVED[lang]
 
         # Window / groups
         self.setWindowTitle(self.tr("title"))
@@ -604,12 +1668,20 @@ class MainWindow(QMainWindow):
         self.btn_cancel.setText(self.tr("btn_cancel"))
 
         self.lbl_interval.setText(self.tr("lbl_interval"))
+        self.lbl_repeats.setText(self.tr("lbl_repeats"))
+        self.lbl_codec.setText(self.tr("lbl_codec"))
+        self.combo_codec.setItemText(0, self.tr("codec_auto"))
+        self.lbl_threads.setText(self.tr("lbl_threads"))
+        self.chk_done_dialog.setText(self.tr("chk_done_dialog"))
         self.lbl_width.setText(self.tr("lbl_width"))
         self.lbl_height.setText(self.tr("lbl_height"))
 
         # Tooltips
-        self.list_widget.setToolTip(self.tr("tip_list"))
+        self.list_view.setToolTip(self.tr("tip_list"))
         self.spin_interval.setToolTip(self.tr("tip_interval"))
+        self.spin_repeats.setToolTip(self.tr("tip_repeats"))
+        self.combo_codec.setToolTip(self.tr("tip_codec"))
+        self.spin_threads.setToolTip(self.tr("tip_threads"))
         self.spin_width.setToolTip(self.tr("tip_size"))
         self.spin_height.setToolTip(self.tr("tip_size"))
         self.btn_choose_out.setToolTip(self.tr("tip_out"))
@@ -632,38 +1704,52 @@ class MainWindow(QMainWindow):
 
     # -------- list handling --------
 
-    def add_images(self, paths: List[str]):
-        # De-duplicate paths while keeping order
-        existing = {norm_path(self.list_widget.item(i).text()) for i in range(self.list_widget.count())}
-        added = 0
+    def add_images(self, paths: List[str], checked: bool = False):
+        # `checked`: paths are existing image files already (folders expanded by the caller)
+        # De-duplicate paths while keeping order (new keys go straight into the known set)
+        existing = self._known
+        new_paths: List[str] = []
         for p in paths:
             if not p:
                 continue
-            if os.path.isdir(p):
-                for fp in collect_images_from_folder(p):
-                    key = norm_path(fp)
-                    if key in existing:
-                        continue
-                    self._add_item(fp)
-                    existing.add(key)
-                    added += 1
+            if checked:
+                files = (p,)
+            elif os.path.isdir(p):
+                files = collect_images_from_folder(p)
+            elif has_supported_ext(p) and os.path.isfile(p):
+                files = (p,)
             else:
-                if not (os.path.isfile(p) and p.lower().endswith(SUPPORTED_EXTS)):
-                    continue
-                key = norm_path(p)
+                continue
+
+            for fp in files:
+                key = norm_path(fp)
                 if key in existing:
                     continue
-                self._add_item(p)
+                new_paths.append(fp)
                 existing.add(key)
-                added += 1
-
-        if added:
-            self.status.showMessage(self.tr("status_added", added=added), 2500)
 
-    def _add_item(self, p: str):
-        item = QListWidgetItem(p)
-        item.setToolTip(p)
-        self.list_widget.addItem(item)
+        if new_paths:
+            self._add_items(new_paths)
+            self.status.showMessage(self.tr("status_added", added=len(new_paths)), 2500)
+
+    def scan_paths(self, paths: List[str]):
+        scanner = PathScanner(paths, self)
+        # Everything found is already expanded and checked, no need to stat again
+        scanner.found.connect(lambda files: self.add_images(files, checked=True))
+        scanner.finished.connect(partial(self._scanners.discard, scanner))
+        scanner.finished.connect(scanner.deleteLater)
+        self._scanners.add(scanner)
+        scanner.start()
+
+    def _add_items(self, paths: List[str]):
+        # One batched insert (a single rowsInserted) with repaints suspended;
+        # tooltips come from the model, so there is nothing to set per row
+        view = self.list_view
+        view.setUpdatesEnabled(False)
+        try:
+            view.path_model.append(paths)
+        finally:
+            view.setUpdatesEnabled(True)
 
     def on_add_files(self):
         files, _ = QFileDialog.getOpenFileNames(
@@ -678,11 +1764,15 @@ class MainWindow(QMainWindow):
             self.add_images([folder])
 
     def on_remove_selected(self):
-        for item in self.list_widget.selectedItems():
-            self.list_widget.takeItem(self.list_widget.row(item))
+        model = self.list_view.path_model
+        rows = [i.row() for i in self.list_view.selectionModel().selectedRows()]
+        for row in rows:
+            self._known.discard(norm_path(model.paths[row]))
+        model.remove_rows(rows)
 
     def on_clear(self):
-        self.list_widget.clear()
+        self.list_view.path_model.clear()
+        self._known.clear()
         self.progress.setValue(0)
         self.status.showMessage(self.tr("status_ready"), 3000)
 
@@ -713,7 +1803,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.tr("msg_no_out_title"), self.tr("msg_no_out_text"))
             return
 
-        image_paths = [self.list_widget.item(i).text() for i in range(self.list_widget.count())]
+        # A copy: the list can still be reordered while the worker runs
+        image_paths = list(self.list_view.path_model.paths)
         if not image_paths:
             QMessageBox.warning(self, self.tr("msg_no_images_title"), self.tr("msg_no_images_text"))
             return
@@ -721,15 +1812,20 @@ class MainWindow(QMainWindow):
         width = int(self.spin_width.value())
         height = int(self.spin_height.value())
         interval_ms = int(self.spin_interval.value())
+        repeats = int(self.spin_repeats.value())
+        codec = self.combo_codec.currentData()
+        threads = int(self.spin_threads.value())
 
         self.progress.setValue(0)
-        self.status.showMessage(self.tr("status_building"))
+        self._status_prefix = self.tr("status_building")
+        self.status.showMessage(self._status_prefix)
         self.set_busy(True)
 
-        self.worker = VideoWorker(image_paths, self.out_path, width, height, interval_ms)
-        self.worker.progress.connect(self.progress.setValue)
-        self.worker.step.connect(self.on_worker_step)
-        self.worker.finished.connect(self.on_worker_finished)
+        self.worker = VideoWorker(image_paths, self.out_path, width, height, interval_ms, repeats, codec, threads)
+        # Emitted from the worker thread; queued explicitly instead of Qt deciding per emit
+        self.worker.progress.connect(self.progress.setValue, Qt.QueuedConnection)
+        self.worker.step.connect(self.on_worker_step, Qt.QueuedConnection)
+        self.worker.finished.connect(self.on_worker_finished, Qt.QueuedConnection)
         self.worker.start()
 
     def on_cancel(self):
@@ -737,47 +1833,124 @@ class MainWindow(QMainWindow):
             self.status.showMessage(self.tr("status_cancel_requested"))
             self.worker.requestInterruption()
 
+    @pyqtSlot(int, int, str)
     def on_worker_step(self, idx: int, total: int, path: str):
-        base = os.path.basename(path)
-        self.status.showMessage(f"{self.tr('status_building')}  {idx}/{total}: {base}")
+        # The language cannot change while a video is being built
+        self.status.showMessage(f"{self._status_prefix}  {idx}/{total}: {base_name(path)}")
 
+    @pyqtSlot(bool, str, str)
     def on_worker_finished(self, ok: bool, code: str, detail: str):
-        self.set_busy(False)
-        if code == "done" and ok:
-            msg = self.tr("status_done", path=detail)
-
-            examples = ""
-            if self.worker is not None and getattr(self.worker, "skipped", None):
-                skipped = len(self.worker.skipped)
-                if skipped:
-                    sample = [os.path.basename(p) for p in self.worker.skipped[:10]]
-                    examples = "\n\n" + self.tr("msg_skipped", n=skipped)
-                    if sample:
-                        examples += "\n" + self.tr("msg_skipped_examples", items="\n".join(sample))
-
-            full_msg = msg + examples
-            self.status.showMessage(msg, 10000)
-            QMessageBox.information(self, self.tr("msg_done_title"), full_msg)
+        # Drop the finished worker (and its skipped list) now instead of keeping it until
+        # the next run. run() has already cleaned up when it emits; wait() lets it return.
+        worker, self.worker = self.worker, None
+        if worker is not None:
+            # A run has exactly one result: cut the connection right away (PyQt5 has no
+            # Qt.SingleShotConnection) so nothing else is dispatched from this worker
+            try:
+                worker.finished.disconnect(self.on_worker_finished)
+            except TypeError:
+                pass  # not connected
+            worker.wait()
+            worker.deleteLater()
+
+        handler = self._finish_handlers.get(code, self._finish_error)
+        if code == "done" and not ok:
+            handler = self._finish_error
+        handler(worker, code, detail)
+
+    # Finish handlers, picked by result code in on_worker_finished. Fixed strings come
+    # straight from the resolved language table (every key is present there); tr() is
+    # only needed where something gets formatted in.
+
+    def _finish_done(self, worker: Optional[VideoWorker], code: str, detail: str):
+        tr = self.tr
+        msg = tr("status_done", path=detail)
+        if not self.chk_done_dialog.isChecked():
+            self._report_finished(msg, 10000)  # status bar only, no summary to build
             return
-
-        if code == "cancelled":
-            self.status.showMessage(self.tr("status_cancelled"), 8000)
-            QMessageBox.information(self, self.tr("msg_cancel_title"), self.tr("msg_cancel_text"))
+        if self._use_native_toast and not self.isActiveWindow():
+            # Window is in the background: short notification, no summary to build
+            self._report_finished(msg, 10000)
+            self._show_toast(self._t["msg_done_title"], msg)
             return
+        text = msg
+
+        # The skipped-files summary only goes into the dialog, and is only
+        # assembled (in a single join) when something was actually skipped
+        skipped = worker.skipped if worker is not None else None
+        if skipped:
+            text = "".join((
+                msg,
+                "\n\n", tr("msg_skipped", n=len(skipped)),
+                "\n", tr("msg_skipped_examples", items=worker.skipped_examples),
+            ))
+        self._report_finished(msg, 10000, self._info_box, self._t["msg_done_title"], text)
+
+    def _finish_cancelled(self, worker: Optional[VideoWorker], code: str, detail: str):
+        strings = self._t
+        self._report_finished(
+            strings["status_cancelled"], 8000,
+            self._info_box, strings["msg_cancel_title"], strings["msg_cancel_text"],
+        )
 
-        if code == "writer_open_failed":
-            msg = self.tr("msg_writer_fail")
-            self.status.showMessage(msg, 10000)
-            QMessageBox.critical(self, self.tr("msg_error_title"), msg)
+    def _finish_writer_failed(self, worker: Optional[VideoWorker], code: str, detail: str):
+        msg = self._t["msg_writer_fail"]
+        self._report_finished(msg, 10000, self._error_box, self._t["msg_error_title"], msg)
+
+    def _finish_error(self, worker: Optional[VideoWorker], code: str, detail: str):
+        err = detail or code
+        if len(err) > ERROR_TEXT_MAX:
+            err = err[:ERROR_TEXT_MAX] + "…"
+        msg = self.tr("msg_generic_error", err=err)
+        self._report_finished(msg, 10000, self._error_box, self._t["msg_error_title"], msg)
+
+    def _show_toast(self, title: str, text: str):
+        if self._tray is None:
+            icon = self.windowIcon()
+            if icon.isNull():
+                icon = self.style().standardIcon(QStyle.SP_DialogApplyButton)
+            self._tray = QSystemTrayIcon(icon, self)
+            self._tray.messageClicked.connect(self._on_toast_clicked)
+        self._tray.setToolTip(self.windowTitle())
+        self._tray.show()
+        self._tray.showMessage(title, text, QSystemTrayIcon.Information, 8000)
+
+    def _on_toast_clicked(self):
+        self._tray.hide()
+        self.showNormal()
+        self.activateWindow()
+
+    def changeEvent(self, event):
+        # The tray icon only exists for the notification; it goes away once the
+        # user is back in the window
+        if (event.type() == QEvent.ActivationChange and self._tray is not None
+                and self._tray.isVisible() and self.isActiveWindow()):
+            self._tray.hide()
+        super().changeEvent(event)
+
+    def _make_box(self, icon) -> QMessageBox:
+        box = QMessageBox(self)
+        box.setIcon(icon)
+        box.setStandardButtons(QMessageBox.Ok)
+        return box
+
+    def _report_finished(self, status_msg: str, timeout: int, box: Optional[QMessageBox] = None,
+                         title: str = "", text: str = ""):
+        # Qt already coalesces these updates into one paint before the dialog opens
+        self.set_busy(False)
+        self.status.showMessage(status_msg, timeout)
+        if box is None:
             return
-
-        # generic error
-        msg = self.tr("msg_generic_error", err=detail or code)
-        self.status.showMessage(msg, 10000)
-        QMessageBox.critical(self, self.tr("msg_error_title"), msg)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec_()
 
 
 def main():
+    multiprocessing.freeze_support()
+    if "--verbose" in sys.argv[1:]:
+        # Pillow decodes only the formats OpenCV cannot read, but say which build is in use
+        print(f"Using {pillow_build()}, OpenCV {cv2.__version__}", file=sys.stderr)
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()